@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from src.ui.colors import GREEN, MAGENTA, RESET
-from src.utils.actions import add_artist, list_artists, quit, remove_artist
+from src.utils.actions import add_artist, audit_artists, list_artists, quit, refresh_artists, remove_artist
 from src.utils.input_validator import Input
 from src.utils.setup import InitialSetup
 
@@ -45,7 +45,19 @@ def main_menu() -> tuple[str, dict]:
             'continue_prompt': True,
         },
         '4': {
-            'choice_name': f'\n\t[{GREEN}4{RESET}] Quit App',
+            'choice_name': f'\n\t[{GREEN}4{RESET}] Audit Monitored Artists Against Spotify',
+            'function': audit_artists,
+            'token_needed': True,
+            'continue_prompt': True,
+        },
+        '5': {
+            'choice_name': f'\n\t[{GREEN}5{RESET}] Refresh Artist List From Table',
+            'function': refresh_artists,
+            'token_needed': False,
+            'continue_prompt': True,
+        },
+        '6': {
+            'choice_name': f'\n\t[{GREEN}6{RESET}] Quit App',
             'function': quit,
             'token_needed': False,
             'continue_prompt': False,
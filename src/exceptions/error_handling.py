@@ -47,3 +47,15 @@ class FailedToRemoveArtistFromTable(Exception):
 
     def __str__(self) -> str:
         return f'{RED}\nFailed to remove artist from DynamoDB table: \n\n{self.error_message}'
+
+
+class FailedToRefreshArtistMetadata(Exception):
+    """
+    Raised when a GET request to the Spotify API for several artists at once fails
+    """
+
+    def __init__(self, error_message: str) -> None:
+        self.error_message = error_message
+
+    def __str__(self) -> str:
+        return f'{RED}\nFailed to refresh metadata of monitored artists from Spotify API: \n\n{self.error_message}'
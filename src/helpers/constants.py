@@ -1,6 +1,7 @@
 import os
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
 
 class Stage(Enum):
@@ -32,3 +33,10 @@ accounts: dict[str, Account] = {
         api_gw_endpoint_ssm_param_name='/Spotificity/ApiGatewayEndpointUrl/prod',
     ),
 }
+
+
+# Directory holding on-disk state shared between concurrently running CLI sessions
+CACHE_DIR: Path = Path.home() / '.spotificity' / 'cache'
+
+# How long the cached artist list is trusted before it is refetched from the Lambda
+CACHE_TTL_SECONDS = 300
@@ -0,0 +1,213 @@
+import codecs
+import os
+import select
+import sys
+import threading
+from typing import Callable
+
+from .colors import GREEN, RESET, YELLOW
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: fall back to a plain `input()` prompt
+    termios = None
+    tty = None
+
+BACKSPACE_KEYS = ('\x7f', '\x08')
+ENTER_KEYS = ('\r', '\n')
+ESCAPE_KEY = '\x1b'
+# Special keys send `\x1b[`, then any parameter bytes, then a final byte in 0x40-0x7E, e.g. Delete is `\x1b[3~`
+# and Ctrl+Right is `\x1b[1;5C`. Some terminals send `\x1bO` and a single byte instead, e.g. `\x1bOA` for Up.
+CONTROL_SEQUENCE_INTRODUCER = '['
+SINGLE_SHIFT_INTRODUCER = 'O'
+CONTROL_SEQUENCE_FINAL_BYTES = ('\x40', '\x7e')
+
+
+class TypeaheadPrompt:
+    """
+    Interactive prompt that searches in the background while the user is still typing.
+
+    Each keystroke restarts a short debounce timer. Once the user pauses, the current query is
+    searched on a background thread and the top candidates are drawn under the prompt. Results are
+    kept per query, so by the time Enter is pressed the search has usually already finished.
+    """
+
+    def __init__(
+        self,
+        search: Callable[[str], list[dict]],
+        local_matches: Callable[[str], list[dict]] | None = None,
+        debounce_seconds: float = 0.3,
+        min_query_length: int = 2,
+        max_candidates: int = 5,
+    ) -> None:
+        """
+        Parameters:
+            - search (Callable): Returns the list of artist search results for a query. Runs on a background thread.
+            - local_matches (Callable): Returns artists from local memory matching a query. Shown before the search finishes.
+        """
+        self._search = search
+        self._local_matches = local_matches
+        self._debounce_seconds = debounce_seconds
+        self._min_query_length = min_query_length
+        self._max_candidates = max_candidates
+
+        self._query = ''
+        self._results: dict[str, list[dict]] = {}  # Finished searches, keyed by query
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()  # Guards `_query`, `_results` and drawing to the terminal
+        self._prompt = '> '
+        self._closed = False  # Set once the prompt has returned, so late searches don't draw over later output
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def ask(self, prompt: str) -> tuple[str, list[dict] | None]:
+        """
+        Prompts the user for an artist name.
+
+        Returns:
+            tuple[str, list[dict] | None]: The entered query, and its search results if the background
+            search already finished. Otherwise None, and the caller has to search itself.
+        """
+        if termios is None or not sys.stdin.isatty():
+            return input(prompt), None
+
+        # Print everything but the last line of the prompt once. The last line is redrawn on every keystroke.
+        header, _, self._prompt = prompt.rpartition('\n')
+        print(header)
+
+        file_descriptor = sys.stdin.fileno()
+        original_settings = termios.tcgetattr(file_descriptor)
+        try:
+            tty.setcbreak(file_descriptor)
+            self._render()
+            self._read_keys()
+        finally:
+            termios.tcsetattr(file_descriptor, termios.TCSADRAIN, original_settings)
+            if self._timer is not None:
+                self._timer.cancel()
+            # Finish the prompt line and close in one step, so a search finishing in between can't redraw below it
+            with self._lock:
+                self._render(show_candidates=False)
+                print()
+                self._closed = True
+
+        return self._query, self._results.get(self._query)
+
+    def _read_keys(self) -> None:
+        while True:
+            key = self._read_key()
+
+            if key in ENTER_KEYS:
+                return
+            elif key == ESCAPE_KEY:
+                self._skip_escape_sequence()
+                continue
+            elif key in BACKSPACE_KEYS:
+                new_query = self._query[:-1]
+            elif key.isprintable():
+                new_query = self._query + key
+            else:
+                continue
+
+            with self._lock:
+                self._query = new_query
+            self._schedule_search(new_query)
+            self._render()
+
+    def _read_key(self) -> str:
+        """
+        Reads one character straight from the terminal. Going around `sys.stdin`'s buffer keeps
+        `select` accurate about whether more input is waiting.
+        """
+        key = ''
+        while not key:
+            key = self._decoder.decode(os.read(sys.stdin.fileno(), 1))
+        return key
+
+    def _has_pending_input(self) -> bool:
+        return bool(select.select([sys.stdin.fileno()], [], [], 0)[0])
+
+    def _skip_escape_sequence(self) -> None:
+        """
+        Swallows the rest of a key sequence such as `\x1b[A` or `\x1b[1;5C`. A lone Esc press isn't followed
+        by anything, so only read on while the rest of a sequence is already waiting.
+        """
+        if not self._has_pending_input():
+            return
+
+        introducer = self._read_key()
+        if introducer == CONTROL_SEQUENCE_INTRODUCER:
+            first_final_byte, last_final_byte = CONTROL_SEQUENCE_FINAL_BYTES
+            while self._has_pending_input():
+                if first_final_byte <= self._read_key() <= last_final_byte:
+                    return
+        elif introducer == SINGLE_SHIFT_INTRODUCER and self._has_pending_input():
+            self._read_key()
+
+    def _schedule_search(self, query: str) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+        if len(query.strip()) < self._min_query_length or query in self._results:
+            return
+
+        self._timer = threading.Timer(self._debounce_seconds, self._run_search, args=(query,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run_search(self, query: str) -> None:
+        try:
+            results = self._search(query)
+        except Exception:
+            # Errors are left for the foreground search after Enter to report
+            return
+
+        with self._lock:
+            if self._closed:
+                return
+            self._results[query] = results
+            is_current_query = query == self._query
+        if is_current_query:
+            self._render()
+
+    def _render(self, show_candidates: bool = True) -> None:
+        with self._lock:
+            if self._closed:
+                return
+
+            candidate_lines = self._candidate_lines() if show_candidates else []
+
+            # Redraw from the start of the prompt line, clearing any candidates drawn last time
+            sys.stdout.write(f'\r\033[J{self._prompt}{self._query}')
+            for line in candidate_lines:
+                sys.stdout.write(f'\n{line}')
+
+            # Move the cursor back up to the end of the query
+            if candidate_lines:
+                sys.stdout.write(f'\033[{len(candidate_lines)}A\r')
+                cursor_column = len(self._prompt) + len(self._query)
+                if cursor_column:
+                    sys.stdout.write(f'\033[{cursor_column}C')
+            sys.stdout.flush()
+
+    def _candidate_lines(self) -> list[str]:
+        # Caller must hold `_lock`
+        query = self._query
+        lines = []
+
+        if self._local_matches is not None and len(query.strip()) >= self._min_query_length:
+            for artist in self._local_matches(query)[: self._max_candidates]:
+                genres = artist.get('genres')
+                genres_str = f' ({", ".join(genre.title() for genre in genres)})' if genres else ''
+                lines.append(f'  {YELLOW}*{RESET} {artist["artist_name"]}{genres_str} {YELLOW}(already monitored){RESET}')
+
+        if query in self._results:
+            if not self._results[query]:
+                lines.append(f'  {YELLOW}No artists found that closely match your search.{RESET}')
+            for artist in self._results[query][: self._max_candidates]:
+                genres_str = ', '.join(genre.title() for genre in artist['genres']) if artist['genres'] else 'N/A'
+                lines.append(f'  {GREEN}-{RESET} {artist["name"]} ({genres_str})')
+        elif len(query.strip()) >= self._min_query_length:
+            lines.append('  Searching...')
+
+        return lines
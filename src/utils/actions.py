@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from random import choice
 
 from ..exceptions.error_handling import (
@@ -8,14 +9,18 @@ from ..exceptions.error_handling import (
     FailedToRetrieveMonitoredArtists,
 )
 from ..ui.colors import GREEN, RED, RESET, YELLOW
+from ..ui.typeahead import TypeaheadPrompt
 from ..utils.input_validator import Input
+from .artist_cache import ArtistCache
 from .signed_requests import Requests
+from .spotify_requests import MAX_IDS_PER_ARTISTS_REQUEST, SpotifyRequests
 
 YES_CHOICES = ['y', 'yes', 'yeah', 'yup', 'yep', 'yea', 'ya', 'yah']
 NO_CHOICES = ['n', 'no', 'nope', 'nah', 'naw', 'na']
 GO_BACK_CHOICES = ['b', 'back']
 CACHED_ARTIST_LIST: list = []  # Local memory storage of the current artists I am monitoring
-IS_CACHE_EMPTY: bool = False
+CACHED_ARTIST_VERSION: int | None = None  # Version of the shared on-disk cache `CACHED_ARTIST_LIST` was loaded from
+AUDIT_MAX_CONCURRENT_REQUESTS = 4  # Batches of artist IDs sent to Spotify at the same time during an audit
 
 
 def list_artists(apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
@@ -26,43 +31,113 @@ def list_artists(apigw_endpoint: str, aws_profile: str, continue_prompt=False) -
         - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
     """
 
-    global CACHED_ARTIST_LIST, IS_CACHE_EMPTY
+    sync_artist_cache(apigw_endpoint, aws_profile)
 
-    # Check if either the cache has items or the `IS_CACHE_EMPTY` flag is set to True
-    # If neither is true, invoke Lambda to fetch fresh data
-    if len(CACHED_ARTIST_LIST) > 0 or IS_CACHE_EMPTY:
-        if CACHED_ARTIST_LIST:
-            for index, artist in enumerate(CACHED_ARTIST_LIST, start=1):
+    if CACHED_ARTIST_LIST:
+        print('\nCurrent monitored artists:')
+        for index, artist in enumerate(CACHED_ARTIST_LIST, start=1):
+            # Point out artists an audit found to be renamed on Spotify since they were added
+            if artist['spotify_name'] and artist['spotify_name'] != artist['artist_name']:
+                print(f'\n\t[{GREEN}{index}{RESET}] {artist["artist_name"]} (now {artist["spotify_name"]} on Spotify)')
+            else:
                 print(f'\n\t[{GREEN}{index}{RESET}] {artist["artist_name"]}')
-        else:
-            print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
+
+            # Genres are only known once an audit has fetched them from Spotify
+            if artist['genres']:
+                print(f'\t    Genre(s): {", ".join(genre.title() for genre in artist["genres"])}')
     else:
-        # Fetch fresh data
-        response = Requests.signed_request('GET', f'{apigw_endpoint}artist', aws_profile)
+        print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
 
-        if response.status_code == 204:
-            print(f'{YELLOW}\n\tNo artists currently being monitored.{RESET}')
-            CACHED_ARTIST_LIST = []
-            IS_CACHE_EMPTY = True
-            return None
+    menu_loop_prompt(continue_prompt)
 
-        response_data: dict = response.json()
-        if response_data.get('error_type') == 'Client':
-            raise FailedToRetrieveMonitoredArtists(response_data['error'])
 
-        print('\nCurrent monitored artists:')
-        list_of_names: list[str] = response_data['artists']['current_artists_names']
-        for index, artist in enumerate(list_of_names, start=1):
-            print(f'\n\t[{GREEN}{index}{RESET}] {artist}')
+def refresh_artists(apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
+    """
+    Refetches the list of monitored artists from the DynamoDB table, even if the cached list is still fresh,
+    and prints it out
 
-        CACHED_ARTIST_LIST = response_data['artists']['current_artists_with_id']
-        IS_CACHE_EMPTY = False
+    Parameters:
+        - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
+    """
 
-    menu_loop_prompt(continue_prompt)
+    sync_artist_cache(apigw_endpoint, aws_profile, force_refresh=True)
+    list_artists(apigw_endpoint, aws_profile, continue_prompt)
+
+
+def sync_artist_cache(apigw_endpoint: str, aws_profile: str, force_refresh=False) -> None:
+    """
+    Makes sure `CACHED_ARTIST_LIST` matches the on-disk cache shared with other running sessions.
+    Only the first session to find the shared cache empty or expired invokes the Lambda; any others wait
+    on the cache lock and then read what it fetched. Otherwise, the local copy is only reloaded once
+    another session has changed the list and bumped the cache version.
+
+    Parameters:
+        - force_refresh (boolean): Refetch from the Lambda even if the shared cache hasn't expired yet.
+    """
+
+    global CACHED_ARTIST_LIST, CACHED_ARTIST_VERSION
+
+    shared_cache = ArtistCache.for_profile(aws_profile)
+    if not force_refresh and shared_cache.version() == CACHED_ARTIST_VERSION and shared_cache.is_fresh():
+        return
+
+    with shared_cache.lock():
+        if force_refresh or not shared_cache.is_fresh():
+            shared_cache.replace(fetch_monitored_artists(apigw_endpoint, aws_profile))
+        CACHED_ARTIST_VERSION, CACHED_ARTIST_LIST = shared_cache.load()
+
+
+def fetch_monitored_artists(apigw_endpoint: str, aws_profile: str) -> list[dict]:
+    """
+    Invokes Lambda to fetch the current list of monitored artists from the DynamoDB table
+
+    Returns:
+        list[dict]: The monitored artists, each with an `artist_id` and `artist_name`
+    """
+
+    response = Requests.signed_request('GET', f'{apigw_endpoint}artist', aws_profile)
+
+    if response.status_code == 204:
+        return []
+
+    response_data: dict = response.json()
+    if response_data.get('error_type') == 'Client':
+        raise FailedToRetrieveMonitoredArtists(response_data['error'])
+
+    return response_data['artists']['current_artists_with_id']
+
+
+def search_artists(artist_name: str, access_token: str, apigw_endpoint: str, aws_profile: str) -> list[dict]:
+    """
+    Queries Spotify API for the artists that most closely match the given name
+
+    Parameters:
+        - artist_name (str): Name of the artist to search for
+        - access_token (str): Required authenticated Spotify access token to send in API request
+
+    Returns:
+        list[dict]: Spotify's search results, each with the artist's `id`, `name` and `genres`
+    """
+
+    # Search only reads data, so identical searches in flight at the same time can share one request
+    payload = json.dumps({'artist_name': artist_name, 'access_token': access_token})
+    response_data: dict = Requests.signed_json_request(
+        'POST', f'{apigw_endpoint}artist/id', aws_profile, payload=payload.encode(), coalesce=True
+    )
+
+    # Catch any errors that occurred during GET request to Spotify API.
+    if response_data.get('error_type') == 'HTTP':
+        raise FailedToRetrieveListOfMatchesWithIDs(response_data['error'])
+
+    return response_data['artistSearchResultsList']
 
 
 def fetch_artist_id(
-    artist_name: str, access_token: str, apigw_endpoint: str, aws_profile: str
+    artist_name: str,
+    access_token: str,
+    apigw_endpoint: str,
+    aws_profile: str,
+    search_results: list[dict] | None = None,
 ) -> tuple[str, str] | None:
     """
     Queries Spotify API for the Spotify ID of the requested artist. Spotify ID of the artist
@@ -72,23 +147,21 @@ def fetch_artist_id(
     Parameters:
         - artist_name (str): Name of the artist that the user wants to add to monitored list
         - access_token (str): Required authenticated Spotify access token to send in API request
+        - search_results (list[dict]): Results already fetched for `artist_name`. Skips the search if given.
 
     Returns:
         tuple[str, str]: A tuple containing the confirmed artist's Spotify ID and name
     """
 
-    payload = json.dumps({'artist_name': artist_name, 'access_token': access_token})
-    response = Requests.signed_request('POST', f'{apigw_endpoint}artist/id', aws_profile, payload=payload.encode())
+    if search_results is None:
+        search_results = search_artists(artist_name, access_token, apigw_endpoint, aws_profile)
 
-    # Catch any errors that occurred during GET request to Spotify API.
-    if response.json().get('error_type') == 'HTTP':
-        raise FailedToRetrieveListOfMatchesWithIDs(response.json()['error'])
-    elif len(response.json()['artistSearchResultsList']) == 0:
+    if len(search_results) == 0:
         raise FailedToRetrieveListOfMatchesWithIDs('No artists found that closely match your search.')
 
     first_artist_guess = {
-        'artist_id': response.json()['artistSearchResultsList'][0]['id'],
-        'artist_name': response.json()['artistSearchResultsList'][0]['name'],
+        'artist_id': search_results[0]['id'],
+        'artist_name': search_results[0]['name'],
     }
 
     # Serve user the most likely artist they were looking for. Ask for confirmation
@@ -103,7 +176,7 @@ def fetch_artist_id(
     elif answer in NO_CHOICES:
 
         # Print list of the other most likely choices and have them choose
-        for index, artist in enumerate(response.json()['artistSearchResultsList'], start=1):
+        for index, artist in enumerate(search_results, start=1):
             print(f'\n[{GREEN}{index}{RESET}]')
             print(f'\tArtist: {artist["name"]}')
 
@@ -120,15 +193,12 @@ def fetch_artist_id(
         # Prompt user for artist choice again
         user_choice = Input.validate(
             prompt=f'\nWhich artist were you looking for? Select the number. (or enter {YELLOW}`back`{RESET} to return to search prompt)\n> ',
-            valid_choices=[
-                str(option_index)
-                for option_index, artist in enumerate(response.json()['artistSearchResultsList'], start=1)
-            ]
+            valid_choices=[str(option_index) for option_index, artist in enumerate(search_results, start=1)]
             + GO_BACK_CHOICES,
         )
 
         # If user choice matches an option, then return that artist's Spotify ID and name
-        for option_index, artist in enumerate(response.json()['artistSearchResultsList'], start=1):
+        for option_index, artist in enumerate(search_results, start=1):
             if user_choice in GO_BACK_CHOICES:
                 return None
             elif int(user_choice) == option_index:
@@ -145,18 +215,27 @@ def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continu
         - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
     """
 
-    global CACHED_ARTIST_LIST
+    global CACHED_ARTIST_LIST, CACHED_ARTIST_VERSION
 
     while True:
 
         # Show user a list of the artist they are already monitoring and then
         # ask user for which artist they want to search for
+        # Matches are searched in the background while the user types
         list_artists(apigw_endpoint, aws_profile)
-        user_artist_choice = input("\nWhich artist would you like to start monitoring?\n> ")
+        search_prompt = TypeaheadPrompt(
+            search=lambda query: search_artists(query, access_token, apigw_endpoint, aws_profile),
+            local_matches=lambda query: [
+                artist for artist in CACHED_ARTIST_LIST if query.lower() in artist['artist_name'].lower()
+            ],
+        )
+        user_artist_choice, search_results = search_prompt.ask("\nWhich artist would you like to start monitoring?\n> ")
 
-        # Query Spotify API to get a list of the closest matches to the user's search
-        # User will be asked to confirm
-        result = fetch_artist_id(user_artist_choice, access_token, apigw_endpoint, aws_profile)
+        # Query Spotify API to get a list of the closest matches to the user's search, unless
+        # the background search already did. User will be asked to confirm
+        result = fetch_artist_id(
+            user_artist_choice, access_token, apigw_endpoint, aws_profile, search_results=search_results
+        )
 
         # Restart while loop since user wanted a new search
         if result is None:
@@ -167,7 +246,7 @@ def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continu
         artist = {'artist_id': artist_id, 'artist_name': artist_name}
 
         # Find out if artist is already in list. If not, add the artist
-        if artist in CACHED_ARTIST_LIST:
+        if any(cached_artist['artist_id'] == artist_id for cached_artist in CACHED_ARTIST_LIST):
             print(f'\nYou\'re already monitoring {GREEN}{artist_name}{RESET}!')
         else:
             payload = json.dumps(artist)
@@ -178,8 +257,10 @@ def add_artist(access_token: str, apigw_endpoint: str, aws_profile: str, continu
                 raise FailedToAddArtistToTable(response.json()['error'])
             else:
 
-                # Update cache with new addition
-                CACHED_ARTIST_LIST.append(artist)
+                # Update shared cache with new addition so other sessions pick it up too
+                shared_cache = ArtistCache.for_profile(aws_profile)
+                shared_cache.add(artist)
+                CACHED_ARTIST_VERSION, CACHED_ARTIST_LIST = shared_cache.load()
                 print(f'\n\tYou are now monitoring for {GREEN}{artist_name}{RESET}\'s new music!')
                 break
 
@@ -194,7 +275,7 @@ def remove_artist(apigw_endpoint: str, aws_profile: str, continue_prompt=False)
         - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
     """
 
-    global CACHED_ARTIST_LIST
+    global CACHED_ARTIST_LIST, CACHED_ARTIST_VERSION
 
     # If there are currently no artists to remove, then exit the function
     list_artists(apigw_endpoint, aws_profile)
@@ -229,13 +310,97 @@ def remove_artist(apigw_endpoint: str, aws_profile: str, continue_prompt=False)
                 raise FailedToRemoveArtistFromTable(response.json()['error'])
             else:
 
-                # Update cache by removing artist
-                CACHED_ARTIST_LIST.pop(int(user_choice) - 1)
+                # Update shared cache by removing artist so other sessions pick it up too
+                shared_cache = ArtistCache.for_profile(aws_profile)
+                shared_cache.remove(artist['artist_id'])
+                CACHED_ARTIST_VERSION, CACHED_ARTIST_LIST = shared_cache.load()
                 print(f"\n\tRemoved {GREEN}{artist['artist_name']}{RESET} from list!")
 
     menu_loop_prompt(continue_prompt)
 
 
+def audit_artists(access_token: str, apigw_endpoint: str, aws_profile: str, continue_prompt=False) -> None:
+    """
+    Refreshes the names and genres of every monitored artist straight from Spotify, in batches of 50 IDs
+    per request with several batches in flight at once. Flags artists that Spotify renamed, merged
+    into another ID, or no longer knows about.
+
+    Parameters:
+        - access_token (str): Required authenticated Spotify access token to send in API request
+        - continue_prompt (boolean): Whether the user is returned with the main menu after function execution or not.
+    """
+
+    global CACHED_ARTIST_LIST, CACHED_ARTIST_VERSION
+
+    sync_artist_cache(apigw_endpoint, aws_profile)
+    if not CACHED_ARTIST_LIST:
+        print(f"{YELLOW}\n\tThere are no artists to audit!{RESET}")
+        menu_loop_prompt(continue_prompt)
+        return
+
+    artist_ids = [artist['artist_id'] for artist in CACHED_ARTIST_LIST]
+    id_batches = [
+        artist_ids[start : start + MAX_IDS_PER_ARTISTS_REQUEST]
+        for start in range(0, len(artist_ids), MAX_IDS_PER_ARTISTS_REQUEST)
+    ]
+    print(f'\nAuditing {len(artist_ids)} artists in {len(id_batches)} request(s)...')
+
+    with ThreadPoolExecutor(max_workers=AUDIT_MAX_CONCURRENT_REQUESTS) as executor:
+        batch_results = executor.map(lambda batch: SpotifyRequests.get_several_artists(batch, access_token), id_batches)
+
+        # Spotify answers with exactly one entry per requested ID, in the same order
+        spotify_artists_by_id = {
+            artist_id: spotify_artist
+            for id_batch, spotify_batch in zip(id_batches, batch_results, strict=True)
+            for artist_id, spotify_artist in zip(id_batch, spotify_batch, strict=True)
+        }
+
+    refreshed_artists, renamed_artists, merged_artists, dead_artists = [], [], [], []
+    for cached_artist in CACHED_ARTIST_LIST:
+        spotify_artist = spotify_artists_by_id[cached_artist['artist_id']]
+        if spotify_artist is None:
+            dead_artists.append(cached_artist)
+            continue
+
+        # Spotify answers with the surviving artist when the requested ID was merged into another one.
+        # Otherwise, only report names that changed since the last audit, or since the artist was added
+        previous_name = cached_artist['spotify_name'] or cached_artist['artist_name']
+        if spotify_artist['id'] != cached_artist['artist_id']:
+            merged_artists.append((cached_artist, spotify_artist))
+        elif spotify_artist['name'] != previous_name:
+            renamed_artists.append((previous_name, spotify_artist))
+
+        refreshed_artists.append(
+            {
+                'artist_id': cached_artist['artist_id'],
+                'spotify_name': spotify_artist['name'],
+                'genres': spotify_artist['genres'],
+            }
+        )
+
+    # Update shared cache with the refreshed metadata so other sessions pick it up too.
+    # The name stored in the DynamoDB table is kept as is, since the table is what gets updated on add and remove
+    shared_cache = ArtistCache.for_profile(aws_profile)
+    shared_cache.update_metadata(refreshed_artists)
+    CACHED_ARTIST_VERSION, CACHED_ARTIST_LIST = shared_cache.load()
+
+    print(f'\n\tRefreshed {GREEN}{len(refreshed_artists)}{RESET} artist(s).')
+    for previous_name, spotify_artist in renamed_artists:
+        print(f'\n\tRenamed: {previous_name} -> {GREEN}{spotify_artist["name"]}{RESET}')
+    for cached_artist, spotify_artist in merged_artists:
+        print(
+            f'\n\t{YELLOW}Merged:{RESET} {cached_artist["artist_name"]} ({cached_artist["artist_id"]}) '
+            f'is now {spotify_artist["name"]} ({spotify_artist["id"]}). Consider re-adding them.'
+        )
+    for dead_artist in dead_artists:
+        print(
+            f'\n\t{RED}Not found on Spotify:{RESET} {dead_artist["artist_name"]} ({dead_artist["artist_id"]}). '
+            'Consider removing them.'
+        )
+
+    menu_loop_prompt(continue_prompt)
+
+
 def quit() -> None:
     """
     Quits the application with a custom exit message
@@ -250,6 +415,15 @@ def quit() -> None:
         'auf Wiedersehen',  # German
         'arrivederci',  # Italian
     ]
+
+    # Report how many duplicate requests were saved by sharing in-flight ones
+    request_stats = Requests.coalescing_stats()
+    if request_stats['coalesced_requests']:
+        print(
+            f'\n\tSent {request_stats["network_requests"]} request(s), '
+            f'saved {request_stats["coalesced_requests"]} by sharing identical in-flight requests.'
+        )
+
     print(f'{RED}\n\tQuitting App! {choice(goodbye_list).title()}!')
     exit()
 
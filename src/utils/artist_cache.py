@@ -0,0 +1,230 @@
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote
+
+from ..helpers.constants import CACHE_DIR, CACHE_TTL_SECONDS
+
+try:
+    import fcntl
+
+    msvcrt = None
+except ImportError:  # Windows: lock the first byte of the lock file instead
+    import msvcrt
+
+    fcntl = None
+
+# Bump whenever the table layout changes. Caches written with an older layout are dropped and refetched.
+SCHEMA_VERSION = 3
+
+
+class ArtistCache:
+    """
+    On-disk cache of the monitored artists, shared by every CLI session running under the same AWS profile.
+
+    The cache lives in a SQLite database next to a lock file. Every write bumps a monotonically
+    increasing version number, so other sessions only have to read a single integer to find out
+    whether their in-memory copy is stale. The list is refetched from the Lambda once it is older
+    than `CACHE_TTL_SECONDS`, so changes made outside this machine still show up.
+    """
+
+    _instances: dict[str, 'ArtistCache'] = {}
+
+    def __init__(self, aws_profile: str, cache_dir: Path = CACHE_DIR) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Profile names may contain characters such as `/` that aren't valid in a file name
+        file_stem = quote(aws_profile, safe='')
+        self._db_path = cache_dir / f'{file_stem}.sqlite3'
+        self._lock_path = cache_dir / f'{file_stem}.lock'
+        self._create_tables()
+
+    @classmethod
+    def for_profile(cls, aws_profile: str) -> 'ArtistCache':
+        """
+        Returns the cache for the given AWS profile, creating it on first use
+        """
+        if aws_profile not in cls._instances:
+            cls._instances[aws_profile] = cls(aws_profile)
+        return cls._instances[aws_profile]
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Holds an exclusive lock on the cache across processes.
+        Used to make sure only one session fetches the artist list while the others wait for it.
+        """
+        with open(self._lock_path, 'a+') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def version(self) -> int:
+        """
+        Current version of the cache. Cheap enough to call before every read.
+        """
+        with self._connect() as connection:
+            return self._read_version(connection)
+
+    def is_fresh(self, ttl_seconds: int = CACHE_TTL_SECONDS) -> bool:
+        """
+        Whether a session has fetched the artist list from the Lambda within the last `ttl_seconds`
+        """
+        with self._connect() as connection:
+            fetched_at = connection.execute("SELECT value FROM metadata WHERE key = 'fetched_at'").fetchone()[0]
+        return fetched_at > 0 and time.time() - fetched_at < ttl_seconds
+
+    def load(self) -> tuple[int, list[dict]]:
+        """
+        Returns the cache version along with the artists it holds, read in a single transaction
+        """
+        with self._connect() as connection:
+            connection.execute('BEGIN')
+            version = self._read_version(connection)
+            rows = connection.execute(
+                'SELECT artist_id, artist_name, spotify_name, genres FROM artists ORDER BY position'
+            ).fetchall()
+            connection.execute('COMMIT')
+
+        return version, [
+            {
+                'artist_id': artist_id,
+                'artist_name': artist_name,
+                'spotify_name': spotify_name,
+                'genres': json.loads(genres),
+            }
+            for artist_id, artist_name, spotify_name, genres in rows
+        ]
+
+    def replace(self, artists: list[dict]) -> int:
+        """
+        Overwrites the cache with a freshly fetched list of artists. Returns the new version.
+        Spotify metadata refreshed by an audit is kept for the artists that are still in the list.
+        """
+        with self._write() as connection:
+            spotify_metadata = {
+                artist_id: (spotify_name, genres)
+                for artist_id, spotify_name, genres in connection.execute(
+                    'SELECT artist_id, spotify_name, genres FROM artists'
+                )
+            }
+            connection.execute('DELETE FROM artists')
+            connection.execute("UPDATE metadata SET value = ? WHERE key = 'fetched_at'", (int(time.time()),))
+            connection.executemany(
+                'INSERT INTO artists (position, artist_id, artist_name, spotify_name, genres) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (position, artist['artist_id'], artist['artist_name'])
+                    + spotify_metadata.get(artist['artist_id'], (None, '[]'))
+                    for position, artist in enumerate(artists)
+                ],
+            )
+            return self._bump_version(connection)
+
+    def add(self, artist: dict) -> int:
+        """
+        Appends an artist to the cache. Returns the new version.
+        """
+        with self._write() as connection:
+            connection.execute(
+                '''
+                INSERT OR REPLACE INTO artists (position, artist_id, artist_name)
+                VALUES ((SELECT COALESCE(MAX(position), -1) + 1 FROM artists), ?, ?)
+                ''',
+                (artist['artist_id'], artist['artist_name']),
+            )
+            return self._bump_version(connection)
+
+    def update_metadata(self, artists: list[dict]) -> int:
+        """
+        Updates the current Spotify name and genres of artists already in the cache. The name stored in the
+        DynamoDB table (`artist_name`) is left as is, so it keeps matching the table. Returns the new version.
+
+        Parameters:
+            - artists (list[dict]): Artists with an `artist_id`, `spotify_name` and `genres`
+        """
+        with self._write() as connection:
+            connection.executemany(
+                'UPDATE artists SET spotify_name = ?, genres = ? WHERE artist_id = ?',
+                [(artist['spotify_name'], json.dumps(artist['genres']), artist['artist_id']) for artist in artists],
+            )
+            return self._bump_version(connection)
+
+    def remove(self, artist_id: str) -> int:
+        """
+        Removes an artist from the cache. Returns the new version.
+        """
+        with self._write() as connection:
+            connection.execute('DELETE FROM artists WHERE artist_id = ?', (artist_id,))
+            return self._bump_version(connection)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit mode so transactions are controlled explicitly with BEGIN/COMMIT
+        connection = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a write transaction. `BEGIN IMMEDIATE` takes SQLite's write lock up front,
+        so concurrent writers queue up instead of failing halfway through.
+        """
+        with self._connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            else:
+                connection.execute('COMMIT')
+
+    def _create_tables(self) -> None:
+        with self.lock(), self._write() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            connection.execute("INSERT OR IGNORE INTO metadata (key, value) VALUES ('version', 0)")
+            connection.execute("INSERT OR IGNORE INTO metadata (key, value) VALUES ('fetched_at', 0)")
+
+            # Outdated layout: drop the artists but keep the version counter so it never goes backwards
+            if connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                connection.execute('DROP TABLE IF EXISTS artists')
+                connection.execute("UPDATE metadata SET value = 0 WHERE key = 'fetched_at'")
+                connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+                self._bump_version(connection)
+
+            connection.execute(
+                '''
+                CREATE TABLE IF NOT EXISTS artists (
+                    artist_id TEXT PRIMARY KEY,
+                    artist_name TEXT NOT NULL,
+                    spotify_name TEXT,
+                    genres TEXT NOT NULL DEFAULT '[]',
+                    position INTEGER NOT NULL
+                )
+                '''
+            )
+
+    @staticmethod
+    def _read_version(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()[0]
+
+    @staticmethod
+    def _bump_version(connection: sqlite3.Connection) -> int:
+        connection.execute("UPDATE metadata SET value = value + 1 WHERE key = 'version'")
+        return ArtistCache._read_version(connection)
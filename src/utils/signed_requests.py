@@ -1,3 +1,5 @@
+import threading
+
 import requests
 from boto3 import Session
 from requests import HTTPError, Response
@@ -14,13 +16,118 @@ class FailedToSendSignedRequest(Exception):
         return f'\n\n{RED}Failed to send signed request:\n{self.err}'
 
 
+_NOT_DECODED = object()  # Marks a body that hasn't been decoded yet, since JSON `null` decodes to None
+
+
+class _InFlightRequest:
+    """
+    A request currently being sent, which identical concurrent requests wait on instead of sending their own
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Response | None = None
+        self.error: BaseException | None = None
+        self._decoded_body = _NOT_DECODED
+        self._decode_lock = threading.Lock()
+
+    def json(self) -> dict:
+        """
+        Response body decoded from JSON. Decoded once, then shared by every caller waiting on this request.
+        """
+        with self._decode_lock:
+            if self._decoded_body is _NOT_DECODED:
+                self._decoded_body = self.response.json()
+            return self._decoded_body
+
+
 class Requests:
     """
     Class for sending signed HTTP requests to AWS services.
+
+    Identical idempotent requests sent concurrently are coalesced: the first one goes out over the
+    network and the rest wait for it and share its response.
     """
 
-    @staticmethod
-    def signed_request(method: str, url: str, aws_profile: str, service='execute-api', payload=None) -> Response:
+    IDEMPOTENT_METHODS = ('GET',)
+
+    _in_flight: dict[tuple, _InFlightRequest] = {}
+    _in_flight_lock = threading.Lock()
+    _stats = {'network_requests': 0, 'coalesced_requests': 0}
+
+    @classmethod
+    def signed_request(
+        cls, method: str, url: str, aws_profile: str, service='execute-api', payload=None, coalesce=None
+    ) -> Response:
+        """
+        Parameters:
+            - coalesce (bool): Whether to share the response with identical concurrent requests.
+              Defaults to True for idempotent methods. Pass True for POSTs that only read data.
+        """
+        return cls._request(method, url, aws_profile, service, payload, coalesce).response
+
+    @classmethod
+    def signed_json_request(
+        cls, method: str, url: str, aws_profile: str, service='execute-api', payload=None, coalesce=None
+    ) -> dict:
+        """
+        Same as `signed_request`, but returns the decoded JSON body. Coalesced callers share a single decoded body,
+        so it must not be modified.
+        """
+        return cls._request(method, url, aws_profile, service, payload, coalesce).json()
+
+    @classmethod
+    def _request(
+        cls, method: str, url: str, aws_profile: str, service: str, payload, coalesce: bool | None
+    ) -> _InFlightRequest:
+        if coalesce is None:
+            coalesce = method in cls.IDEMPOTENT_METHODS
+
+        if not coalesce:
+            request = _InFlightRequest()
+            request.response = cls._send(method, url, aws_profile, service, payload)
+            return request
+
+        request_key = (method, url, aws_profile, service, payload)
+        with cls._in_flight_lock:
+            in_flight = cls._in_flight.get(request_key)
+            is_leader = in_flight is None
+            if is_leader:
+                in_flight = cls._in_flight[request_key] = _InFlightRequest()
+            else:
+                cls._stats['coalesced_requests'] += 1
+
+        # Another thread is already sending this exact request. Wait for its result
+        if not is_leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight
+
+        try:
+            in_flight.response = cls._send(method, url, aws_profile, service, payload)
+            return in_flight
+        except BaseException as err:
+            in_flight.error = err
+            raise
+        finally:
+            with cls._in_flight_lock:
+                del cls._in_flight[request_key]
+            in_flight.done.set()
+
+    @classmethod
+    def coalescing_stats(cls) -> dict[str, int]:
+        """
+        Number of requests actually sent over the network, and number saved by sharing an in-flight request
+        """
+        with cls._in_flight_lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def _send(cls, method: str, url: str, aws_profile: str, service: str, payload) -> Response:
+        with cls._in_flight_lock:
+            cls._stats['network_requests'] += 1
+
         credentials = Session(profile_name=aws_profile).get_credentials()
         auth = AWS4Auth(
             credentials.access_key,
@@ -0,0 +1,56 @@
+import time
+
+import requests
+from requests import HTTPError, Response
+
+from ..exceptions.error_handling import FailedToRefreshArtistMetadata
+
+SPOTIFY_API_BASE_URL = 'https://api.spotify.com/v1/'
+MAX_IDS_PER_ARTISTS_REQUEST = 50  # Spotify's limit for the `Get Several Artists` endpoint
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class SpotifyRequests:
+    """
+    Class for sending requests straight to the Spotify API with the access token fetched at startup.
+    """
+
+    @staticmethod
+    def get_several_artists(artist_ids: list[str], access_token: str) -> list[dict | None]:
+        """
+        Fetches up to 50 artists from Spotify in a single request
+
+        Parameters:
+            - artist_ids (list[str]): Spotify IDs of the artists to fetch
+            - access_token (str): Required authenticated Spotify access token to send in API request
+
+        Returns:
+            list[dict | None]: Spotify's artist objects, in the same order as `artist_ids`.
+            Entries are None for IDs Spotify no longer knows about.
+        """
+        if len(artist_ids) > MAX_IDS_PER_ARTISTS_REQUEST:
+            raise ValueError(f'At most {MAX_IDS_PER_ARTISTS_REQUEST} artist IDs can be fetched per request')
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response: Response = requests.get(
+                f'{SPOTIFY_API_BASE_URL}artists',
+                params={'ids': ','.join(artist_ids)},
+                headers={'Authorization': f'Bearer {access_token}'},
+            )
+
+            # Back off for as long as Spotify asks when rate limited
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                time.sleep(int(response.headers.get('Retry-After', 1)))
+                continue
+
+            try:
+                response.raise_for_status()
+            except HTTPError as err:
+                raise FailedToRefreshArtistMetadata(str(err))
+
+            spotify_artists: list[dict | None] = response.json()['artists']
+            if len(spotify_artists) != len(artist_ids):
+                raise FailedToRefreshArtistMetadata(
+                    f'Requested {len(artist_ids)} artists but Spotify returned {len(spotify_artists)}'
+                )
+            return spotify_artists
@@ -0,0 +1,5 @@
+import os
+
+# `src.helpers.constants` reads the account IDs at import time
+os.environ.setdefault('SPOTIFICITY_BETA_ACCT', '000000000000')
+os.environ.setdefault('SPOTIFICITY_PROD_ACCT', '000000000000')
@@ -0,0 +1,110 @@
+import json
+import threading
+
+import pytest
+from requests import Response
+
+from src.utils import actions, spotify_requests
+from src.utils.artist_cache import ArtistCache
+
+PROFILE = 'test-profile'
+MONITORED_ARTISTS = [{'artist_id': f'id-{index}', 'artist_name': f'Artist {index}'} for index in range(120)]
+
+
+def fake_response(body: dict) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> ArtistCache:
+    cache = ArtistCache(PROFILE, cache_dir=tmp_path)
+    monkeypatch.setitem(ArtistCache._instances, PROFILE, cache)
+    monkeypatch.setattr(actions, 'CACHED_ARTIST_LIST', [])
+    monkeypatch.setattr(actions, 'CACHED_ARTIST_VERSION', None)
+    monkeypatch.setattr(actions, 'fetch_monitored_artists', lambda apigw_endpoint, aws_profile: MONITORED_ARTISTS)
+    return cache
+
+
+@pytest.fixture
+def spotify(monkeypatch):
+    """
+    Stubs Spotify's `Get Several Artists` endpoint. `artists` maps IDs to the entry Spotify answers with;
+    IDs missing from it come back unchanged. The three batches of a 120 artist audit have to be in flight
+    together to get past the barrier.
+    """
+    requested_batches = []
+    batches_in_flight = threading.Barrier(3, timeout=5)
+    artists = {}
+
+    def fake_get(url, params, headers) -> Response:
+        artist_ids = params['ids'].split(',')
+        requested_batches.append(artist_ids)
+        batches_in_flight.wait()
+        return fake_response(
+            {
+                'artists': [
+                    artists.get(artist_id, {'id': artist_id, 'name': f'Artist {artist_id[3:]}', 'genres': ['pop']})
+                    for artist_id in artist_ids
+                ]
+            }
+        )
+
+    monkeypatch.setattr(spotify_requests.requests, 'get', fake_get)
+    return requested_batches, artists
+
+
+def audit(capsys) -> str:
+    actions.audit_artists('token', 'https/', PROFILE)
+    return capsys.readouterr().out
+
+
+def test_audit_sends_concurrent_batches_of_50_ids(cache, spotify, capsys):
+    requested_batches, artists = spotify
+
+    audit(capsys)
+
+    assert sorted(len(batch) for batch in requested_batches) == [20, 50, 50]
+    assert sorted(artist_id for batch in requested_batches for artist_id in batch) == sorted(
+        artist['artist_id'] for artist in MONITORED_ARTISTS
+    )
+    assert all(artist['genres'] == ['pop'] for artist in cache.load()[1])
+
+
+def test_audit_flags_dead_merged_and_renamed_artists(cache, spotify, capsys):
+    requested_batches, artists = spotify
+    artists['id-5'] = None
+    artists['id-7'] = {'id': 'id-merged', 'name': 'Surviving Artist', 'genres': []}
+    artists['id-9'] = {'id': 'id-9', 'name': 'Artist Nine', 'genres': ['rap']}
+
+    output = audit(capsys)
+
+    assert 'Not found on Spotify:\x1b[0m Artist 5 (id-5)' in output
+    assert 'Artist 7 (id-7) is now Surviving Artist (id-merged)' in output
+    assert 'Renamed: Artist 9 -> \x1b[32mArtist Nine' in output
+    assert 'Renamed: Artist 7' not in output
+
+    artist_nine = next(artist for artist in cache.load()[1] if artist['artist_id'] == 'id-9')
+    assert (artist_nine['artist_name'], artist_nine['spotify_name']) == ('Artist 9', 'Artist Nine')
+
+
+def test_audit_only_reports_renames_once(cache, spotify, capsys):
+    requested_batches, artists = spotify
+    artists['id-9'] = {'id': 'id-9', 'name': 'Artist Nine', 'genres': ['rap']}
+
+    assert 'Renamed: Artist 9' in audit(capsys)
+    assert 'Renamed:' not in audit(capsys)
+
+
+def test_list_shows_spotify_name_and_genres_after_audit(cache, spotify, capsys):
+    requested_batches, artists = spotify
+    artists['id-9'] = {'id': 'id-9', 'name': 'Artist Nine', 'genres': ['hip hop']}
+    audit(capsys)
+
+    actions.list_artists('https/', PROFILE)
+    output = capsys.readouterr().out
+
+    assert 'Artist 9 (now Artist Nine on Spotify)' in output
+    assert 'Genre(s): Hip Hop' in output
@@ -0,0 +1,127 @@
+import sqlite3
+import threading
+
+import pytest
+
+from src.utils import artist_cache
+from src.utils.artist_cache import ArtistCache
+
+ARTISTS = [
+    {'artist_id': 'id-1', 'artist_name': 'Artist One'},
+    {'artist_id': 'id-2', 'artist_name': 'Artist Two'},
+]
+
+
+@pytest.fixture
+def cache(tmp_path) -> ArtistCache:
+    return ArtistCache('test-profile', cache_dir=tmp_path)
+
+
+def test_new_cache_is_empty_and_not_fresh(cache):
+    version, artists = cache.load()
+
+    assert artists == []
+    assert not cache.is_fresh()
+    assert cache.version() == version
+
+
+def test_replace_bumps_version_and_marks_cache_fresh(cache):
+    old_version = cache.version()
+
+    new_version = cache.replace(ARTISTS)
+
+    assert new_version == old_version + 1
+    assert cache.is_fresh()
+    assert [artist['artist_id'] for artist in cache.load()[1]] == ['id-1', 'id-2']
+
+
+def test_cache_expires_after_ttl(cache, monkeypatch):
+    cache.replace(ARTISTS)
+    fetched_at = artist_cache.time.time()
+
+    monkeypatch.setattr(artist_cache.time, 'time', lambda: fetched_at + 60)
+    assert cache.is_fresh(ttl_seconds=120)
+    assert not cache.is_fresh(ttl_seconds=30)
+
+
+def test_add_and_remove_bump_version(cache):
+    cache.replace(ARTISTS)
+    version = cache.version()
+
+    assert cache.add({'artist_id': 'id-3', 'artist_name': 'Artist Three'}) == version + 1
+    assert [artist['artist_id'] for artist in cache.load()[1]] == ['id-1', 'id-2', 'id-3']
+
+    assert cache.remove('id-1') == version + 2
+    assert [artist['artist_id'] for artist in cache.load()[1]] == ['id-2', 'id-3']
+
+
+def test_instances_sharing_a_cache_dir_see_each_others_writes(tmp_path):
+    first_session = ArtistCache('test-profile', cache_dir=tmp_path)
+    second_session = ArtistCache('test-profile', cache_dir=tmp_path)
+
+    first_session.replace(ARTISTS)
+    version = second_session.version()
+    assert second_session.is_fresh()
+    assert second_session.load() == first_session.load()
+
+    second_session.add({'artist_id': 'id-3', 'artist_name': 'Artist Three'})
+    assert first_session.version() == version + 1
+    assert first_session.load()[1][-1]['artist_id'] == 'id-3'
+
+
+def test_concurrent_writers_never_lose_a_version_bump(tmp_path):
+    sessions = [ArtistCache('test-profile', cache_dir=tmp_path) for _ in range(4)]
+    start_version = sessions[0].version()
+
+    def add_artists(session: ArtistCache, session_index: int) -> None:
+        for artist_index in range(10):
+            session.add({'artist_id': f'id-{session_index}-{artist_index}', 'artist_name': 'Artist'})
+
+    threads = [threading.Thread(target=add_artists, args=(session, index)) for index, session in enumerate(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    version, artists = sessions[0].load()
+    assert version == start_version + 40
+    assert len(artists) == 40
+
+
+def test_outdated_schema_is_dropped_without_rewinding_version(tmp_path):
+    cache = ArtistCache('test-profile', cache_dir=tmp_path)
+    cache.replace(ARTISTS)
+    version = cache.version()
+
+    # Pretend the file was written by an older version of the CLI
+    with sqlite3.connect(tmp_path / 'test-profile.sqlite3') as connection:
+        connection.execute(f'PRAGMA user_version = {artist_cache.SCHEMA_VERSION - 1}')
+
+    upgraded_cache = ArtistCache('test-profile', cache_dir=tmp_path)
+
+    assert upgraded_cache.load() == (version + 1, [])
+    assert not upgraded_cache.is_fresh()
+
+
+def test_profile_names_are_escaped_in_file_names(tmp_path):
+    cache = ArtistCache('team/dev', cache_dir=tmp_path)
+    cache.replace(ARTISTS)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['team%2Fdev.lock', 'team%2Fdev.sqlite3']
+
+
+def test_audit_metadata_keeps_stored_name_and_survives_refetch(cache):
+    cache.replace(ARTISTS)
+    version = cache.update_metadata([{'artist_id': 'id-1', 'spotify_name': 'Artist Renamed', 'genres': ['pop']}])
+
+    assert version == cache.version()
+    first_artist = cache.load()[1][0]
+    assert first_artist['artist_name'] == 'Artist One'
+    assert first_artist['spotify_name'] == 'Artist Renamed'
+    assert first_artist['genres'] == ['pop']
+
+    # Refetching from the table keeps the audited metadata of artists that are still monitored
+    cache.replace([ARTISTS[0], {'artist_id': 'id-3', 'artist_name': 'Artist Three'}])
+    first_artist, new_artist = cache.load()[1]
+    assert (first_artist['spotify_name'], first_artist['genres']) == ('Artist Renamed', ['pop'])
+    assert (new_artist['spotify_name'], new_artist['genres']) == (None, [])
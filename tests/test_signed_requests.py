@@ -0,0 +1,155 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from requests import Response
+
+from src.utils import signed_requests
+from src.utils.signed_requests import FailedToSendSignedRequest, Requests
+
+CONCURRENT_CALLERS = 8
+
+
+class FakeSession:
+    def __init__(self, profile_name: str) -> None:
+        self.profile_name = profile_name
+
+    def get_credentials(self) -> SimpleNamespace:
+        return SimpleNamespace(access_key='AKIAEXAMPLE', secret_key='secret', token=None)
+
+
+def fake_response(status_code: int, body: bytes) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = 'https://example.execute-api.us-east-1.amazonaws.com/artist'
+    return response
+
+
+@pytest.fixture(autouse=True)
+def reset_stats(monkeypatch):
+    monkeypatch.setattr(Requests, '_stats', {'network_requests': 0, 'coalesced_requests': 0})
+    monkeypatch.setattr(signed_requests, 'Session', FakeSession)
+
+
+@pytest.fixture
+def blocking_transport(monkeypatch):
+    """
+    Stubs the HTTP calls underneath `Requests._send`. Every call blocks until `release` is set,
+    keeping requests in flight while identical ones pile up behind them.
+    """
+    release = threading.Event()
+    sent = []
+
+    def fake_http_call(url, auth, data, headers) -> Response:
+        sent.append((url, data))
+        release.wait(timeout=5)
+        if url.endswith('broken'):
+            return fake_response(500, b'{"message": "Internal server error"}')
+        return fake_response(200, b'{"artists": ["Artist One"]}')
+
+    for method in ('get', 'post', 'put', 'delete'):
+        monkeypatch.setattr(signed_requests.requests, method, fake_http_call)
+    return release, sent
+
+
+def call_concurrently(target) -> tuple[list[threading.Thread], list, list]:
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(target())
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run) for _ in range(CONCURRENT_CALLERS)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for_waiters(threads, release) -> None:
+    # Give every thread a chance to join the in-flight request before letting it finish
+    deadline = time.monotonic() + 5
+    while Requests.coalescing_stats()['coalesced_requests'] < len(threads) - 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+
+def test_identical_gets_share_one_send(blocking_transport):
+    release, sent = blocking_transport
+
+    threads, results, errors = call_concurrently(lambda: Requests.signed_request('GET', 'https/artist', 'dev'))
+    wait_for_waiters(threads, release)
+
+    assert errors == []
+    assert len(sent) == 1
+    assert len({id(response) for response in results}) == 1
+    assert Requests.coalescing_stats() == {'network_requests': 1, 'coalesced_requests': CONCURRENT_CALLERS - 1}
+    assert Requests._in_flight == {}
+
+
+def test_coalesced_json_requests_decode_once(blocking_transport):
+    release, sent = blocking_transport
+
+    threads, results, errors = call_concurrently(
+        lambda: Requests.signed_json_request('POST', 'https/artist/id', 'dev', payload=b'{}', coalesce=True)
+    )
+    wait_for_waiters(threads, release)
+
+    assert errors == []
+    assert len(sent) == 1
+    assert results[0] == {'artists': ['Artist One']}
+    assert all(result is results[0] for result in results)
+
+
+def test_null_json_body_is_only_decoded_once(monkeypatch, blocking_transport):
+    release, sent = blocking_transport
+    release.set()
+    decode_calls = []
+    monkeypatch.setattr(Response, 'json', lambda response: decode_calls.append(response))
+
+    in_flight = Requests._request('GET', 'https/artist', 'dev', 'execute-api', None, coalesce=True)
+
+    assert in_flight.json() is None
+    assert in_flight.json() is None
+    assert len(decode_calls) == 1
+
+
+def test_errors_are_reraised_to_every_waiter(blocking_transport):
+    release, sent = blocking_transport
+
+    threads, results, errors = call_concurrently(lambda: Requests.signed_request('GET', 'https/broken', 'dev'))
+    wait_for_waiters(threads, release)
+
+    assert results == []
+    assert len(errors) == CONCURRENT_CALLERS
+    assert all(isinstance(err, FailedToSendSignedRequest) for err in errors)
+    assert len(sent) == 1
+    assert Requests.coalescing_stats() == {'network_requests': 1, 'coalesced_requests': CONCURRENT_CALLERS - 1}
+    assert Requests._in_flight == {}
+
+
+def test_non_idempotent_requests_are_not_coalesced(blocking_transport):
+    release, sent = blocking_transport
+    release.set()
+
+    for _ in range(3):
+        Requests.signed_request('POST', 'https/artist', 'dev', payload=b'{}')
+
+    assert len(sent) == 3
+    assert Requests.coalescing_stats() == {'network_requests': 3, 'coalesced_requests': 0}
+
+
+def test_different_payloads_are_sent_separately(blocking_transport):
+    release, sent = blocking_transport
+    release.set()
+
+    Requests.signed_request('POST', 'https/artist/id', 'dev', payload=b'{"a": 1}', coalesce=True)
+    Requests.signed_request('POST', 'https/artist/id', 'dev', payload=b'{"a": 2}', coalesce=True)
+
+    assert len(sent) == 2
+    assert Requests.coalescing_stats() == {'network_requests': 2, 'coalesced_requests': 0}
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from requests import Response
+
+from src.exceptions.error_handling import FailedToRefreshArtistMetadata
+from src.utils import spotify_requests
+from src.utils.spotify_requests import MAX_RATE_LIMIT_RETRIES, SpotifyRequests
+
+
+def fake_response(status_code: int, body: dict | None = None, headers: dict | None = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {}).encode()
+    response.headers.update(headers or {})
+    response.url = 'https://api.spotify.com/v1/artists'
+    return response
+
+
+def spotify_artist(artist_id: str) -> dict:
+    return {'id': artist_id, 'name': f'Name {artist_id}', 'genres': ['pop']}
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    slept = []
+    monkeypatch.setattr(spotify_requests.time, 'sleep', slept.append)
+    return slept
+
+
+def test_requests_all_ids_in_one_call(monkeypatch):
+    calls = []
+
+    def fake_get(url, params, headers) -> Response:
+        calls.append((params, headers))
+        return fake_response(200, {'artists': [spotify_artist(artist_id) for artist_id in params['ids'].split(',')]})
+
+    monkeypatch.setattr(spotify_requests.requests, 'get', fake_get)
+
+    artists = SpotifyRequests.get_several_artists(['id-1', 'id-2'], 'token')
+
+    assert [artist['id'] for artist in artists] == ['id-1', 'id-2']
+    assert calls == [({'ids': 'id-1,id-2'}, {'Authorization': 'Bearer token'})]
+
+
+def test_more_than_50_ids_are_rejected():
+    with pytest.raises(ValueError):
+        SpotifyRequests.get_several_artists([f'id-{index}' for index in range(51)], 'token')
+
+
+def test_rate_limit_waits_for_retry_after(monkeypatch, sleeps):
+    responses = [
+        fake_response(429, headers={'Retry-After': '3'}),
+        fake_response(200, {'artists': [spotify_artist('id-1')]}),
+    ]
+    monkeypatch.setattr(spotify_requests.requests, 'get', lambda url, params, headers: responses.pop(0))
+
+    artists = SpotifyRequests.get_several_artists(['id-1'], 'token')
+
+    assert artists == [spotify_artist('id-1')]
+    assert sleeps == [3]
+
+
+def test_rate_limit_gives_up_after_max_retries(monkeypatch, sleeps):
+    calls = []
+
+    def fake_get(url, params, headers) -> Response:
+        calls.append(params)
+        return fake_response(429, headers={'Retry-After': '1'})
+
+    monkeypatch.setattr(spotify_requests.requests, 'get', fake_get)
+
+    with pytest.raises(FailedToRefreshArtistMetadata):
+        SpotifyRequests.get_several_artists(['id-1'], 'token')
+
+    assert len(calls) == MAX_RATE_LIMIT_RETRIES + 1
+    assert sleeps == [1] * MAX_RATE_LIMIT_RETRIES
+
+
+def test_mismatched_result_length_is_an_error(monkeypatch):
+    monkeypatch.setattr(
+        spotify_requests.requests,
+        'get',
+        lambda url, params, headers: fake_response(200, {'artists': [spotify_artist('id-1')]}),
+    )
+
+    with pytest.raises(FailedToRefreshArtistMetadata):
+        SpotifyRequests.get_several_artists(['id-1', 'id-2'], 'token')
@@ -0,0 +1,165 @@
+import io
+import sys
+import threading
+
+import pytest
+
+from src.ui.typeahead import TypeaheadPrompt
+
+
+class FakeTerminal:
+    """
+    Feeds keys to a prompt in chunks. Keys in the same chunk arrive together, like the bytes of one
+    escape sequence. The next chunk is only "typed" once the current one has been read.
+    """
+
+    def __init__(self, *chunks: str) -> None:
+        self.chunks = [list(chunk) for chunk in chunks]
+
+    def read_key(self) -> str:
+        while not self.chunks[0]:
+            self.chunks.pop(0)
+        return self.chunks[0].pop(0)
+
+    def has_pending_input(self) -> bool:
+        return bool(self.chunks and self.chunks[0])
+
+
+class RecordingSearch:
+    def __init__(self) -> None:
+        self.queries = []
+        self.searched = threading.Event()
+
+    def __call__(self, query: str) -> list[dict]:
+        self.queries.append(query)
+        self.searched.set()
+        return [{'id': f'id-{query}', 'name': query.title(), 'genres': ['rap']}]
+
+
+@pytest.fixture
+def search() -> RecordingSearch:
+    return RecordingSearch()
+
+
+def type_keys(prompt: TypeaheadPrompt, monkeypatch, *chunks: str) -> str:
+    terminal = FakeTerminal(*chunks)
+    monkeypatch.setattr(prompt, '_read_key', terminal.read_key)
+    monkeypatch.setattr(prompt, '_has_pending_input', terminal.has_pending_input)
+    monkeypatch.setattr(prompt, '_schedule_search', lambda query: None)
+
+    prompt._read_keys()
+    return prompt._query
+
+
+def test_debounce_only_searches_the_latest_query(search):
+    prompt = TypeaheadPrompt(search, debounce_seconds=0.05)
+
+    prompt._schedule_search('dr')
+    prompt._schedule_search('dra')
+    prompt._schedule_search('drak')
+    assert search.searched.wait(timeout=2)
+    prompt._timer.join()
+
+    assert search.queries == ['drak']
+
+
+def test_queries_shorter_than_minimum_are_not_searched(search):
+    prompt = TypeaheadPrompt(search, debounce_seconds=0.01, min_query_length=3)
+
+    prompt._schedule_search('dr')
+
+    assert prompt._timer is None
+    assert search.queries == []
+
+
+def test_results_are_stored_per_query_and_not_searched_again(search, capsys):
+    prompt = TypeaheadPrompt(search)
+
+    prompt._run_search('drake')
+    prompt._run_search('future')
+    prompt._schedule_search('drake')
+
+    assert set(prompt._results) == {'drake', 'future'}
+    assert prompt._results['drake'][0]['id'] == 'id-drake'
+    assert prompt._timer is None
+
+
+def test_finished_search_for_current_query_is_drawn(search, capsys):
+    prompt = TypeaheadPrompt(search)
+    prompt._query = 'drake'
+
+    prompt._run_search('drake')
+
+    assert 'Drake (Rap)' in capsys.readouterr().out
+
+
+def test_failed_search_is_left_for_the_caller(capsys):
+    def failing_search(query: str) -> list[dict]:
+        raise RuntimeError('Lambda timed out')
+
+    prompt = TypeaheadPrompt(failing_search)
+    prompt._run_search('drake')
+
+    assert prompt._results == {}
+
+
+def test_nothing_is_drawn_or_stored_once_closed(search, capsys):
+    prompt = TypeaheadPrompt(search)
+    prompt._query = 'drake'
+    prompt._closed = True
+
+    prompt._run_search('drake')
+    prompt._render()
+
+    assert capsys.readouterr().out == ''
+    assert prompt._results == {}
+
+
+def test_arrow_keys_are_skipped(monkeypatch, capsys):
+    prompt = TypeaheadPrompt(RecordingSearch())
+
+    query = type_keys(prompt, monkeypatch, 'a', 'b', '\x1b[D', '\x1bOA', 'c', '\r')
+
+    assert query == 'abc'
+
+
+def test_control_sequences_with_parameters_are_skipped(monkeypatch, capsys):
+    prompt = TypeaheadPrompt(RecordingSearch())
+
+    # Delete, Page Up and Ctrl+Right
+    query = type_keys(prompt, monkeypatch, 'a', 'b', '\x1b[3~', '\x1b[5~', '\x1b[1;5C', 'c', '\r')
+
+    assert query == 'abc'
+
+
+def test_lone_escape_does_not_swallow_later_keys(monkeypatch, capsys):
+    prompt = TypeaheadPrompt(RecordingSearch())
+
+    query = type_keys(prompt, monkeypatch, 'a', '\x1b', 'b', '[', 'c', '\r')
+
+    assert query == 'ab[c'
+
+
+def test_backspace_deletes_last_character(monkeypatch, capsys):
+    prompt = TypeaheadPrompt(RecordingSearch())
+
+    query = type_keys(prompt, monkeypatch, 'd', 'r', 'x', '\x7f', 'a', '\r')
+
+    assert query == 'dra'
+
+
+def test_falls_back_to_input_when_not_a_terminal(search, monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO())
+    monkeypatch.setattr('builtins.input', lambda prompt: 'drake')
+
+    assert TypeaheadPrompt(search).ask('\nWhich artist?\n> ') == ('drake', None)
+    assert search.queries == []
+
+
+def test_monitored_matches_show_cached_genres(search):
+    prompt = TypeaheadPrompt(
+        search, local_matches=lambda query: [{'artist_name': 'Drake', 'genres': ['rap', 'hip hop']}]
+    )
+    prompt._query = 'dra'
+
+    assert 'Drake (Rap, Hip Hop)' in prompt._candidate_lines()[0]